@@ -6,6 +6,9 @@ def perform_search():
     is_searching.set(True)
     search_error.set("")
     search_results.set([])
+    facet_index.set(None)
+    facet_selection.set({})
+    paper_store.release_session(solara.get_kernel_id())
     ranking_criteria.set(None)
     visible_results_count.set(5)
     try:
@@ -15,7 +18,10 @@ def perform_search():
             max_results=10,
             sort_by="relevance"
         )
-        search_results.set(papers)
+        index = FacetIndex()
+        index.add(papers)
+        facet_index.set(index)
+        search_results.set(paper_store.set_session_results(solara.get_kernel_id(), papers))
         ranking_criteria.set(criteria)
     except Exception as e:
         search_error.set(str(e))
@@ -25,24 +31,46 @@ def perform_search():
 
 import solara
 from search_engine import search_papers, Paper, RankingCriteria
+from paper_store import paper_store
+from facets import FacetIndex, toggle_selection
 from components.search_card import SearchCard
 from components.search_bar import SearchBar
 from components.footer import Footer
+from components.facet_panel import FacetPanel
 from components.header import NavBar, HeroHeader
 
 # State management
 search_query = solara.reactive("")
 selected_database = solara.reactive("arXiv")
-search_results = solara.reactive([])  # List of Paper objects
+search_results = solara.reactive([])  # List of PaperRef into the shared paper store
 ranking_criteria = solara.reactive(None)  # RankingCriteria object
 is_searching = solara.reactive(False)
 search_error = solara.reactive("")
 visible_results_count = solara.reactive(5)  # Number of results to display
+facet_index = solara.reactive(None)  # FacetIndex over search_results
+facet_selection = solara.reactive({})  # Facet name -> selected values
+
+def toggle_facet(facet, value):
+    """Switch a facet value on or off; filtering is local, no new search"""
+    facet_selection.set(toggle_selection(facet_selection.value, facet, value))
+    visible_results_count.set(5)
+
+def release_session_papers():
+    """Hand a closing session's papers back to the shared store"""
+    kernel_id = solara.get_kernel_id()
+    return lambda: paper_store.release_session(kernel_id)
+
+solara.lab.on_kernel_start(release_session_papers)
 
 @solara.component
 def Page():
     """Main application"""
     
+    filtered_results = (
+        facet_index.value.filter(search_results.value, facet_selection.value)
+        if facet_index.value is not None else search_results.value
+    )
+
     # Add custom CSS for enhanced animations (optional, can be moved to a static file)
     solara.HTML(unsafe_innerHTML="""
     <style>
@@ -89,12 +117,24 @@ def Page():
             elif search_error.value:
                 solara.Error(f"Error: {search_error.value}")
             elif search_results.value:
-                solara.Markdown(f"### Found {len(search_results.value)} papers", style={"margin-top": "10px", "margin-bottom": "25px", "font-weight": "700", "color": "#0f172a", "font-size": "1.4rem"})
-                visible_papers = search_results.value[:visible_results_count.value]
-                for paper in visible_papers:
-                    SearchCard(paper)
+                with solara.Row(style={"gap": "28px", "align-items": "flex-start", "flex-wrap": "nowrap"}):
+                    if facet_index.value is not None:
+                        FacetPanel(
+                            facet_counts=facet_index.value.counts(facet_selection.value, limit=8),
+                            selection=facet_selection.value,
+                            on_toggle=toggle_facet
+                        )
+                    with solara.Column(style={"flex": "1", "min-width": "0"}):
+                        if len(filtered_results) < len(search_results.value):
+                            heading = f"### Showing {len(filtered_results)} of {len(search_results.value)} papers"
+                        else:
+                            heading = f"### Found {len(search_results.value)} papers"
+                        solara.Markdown(heading, style={"margin-top": "10px", "margin-bottom": "25px", "font-weight": "700", "color": "#0f172a", "font-size": "1.4rem"})
+                        visible_papers = paper_store.resolve_many(filtered_results[:visible_results_count.value])
+                        for paper in visible_papers:
+                            SearchCard(paper).key(paper.url)
 
-            if len(search_results.value) > visible_results_count.value:
+            if len(filtered_results) > visible_results_count.value:
                 pass  # ...existing code for load more button...
                 with solara.Row(style={"justify-content": "center", "margin-top": "20px"}):
                     solara.Button(
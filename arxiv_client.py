@@ -0,0 +1,223 @@
+"""
+arXiv API Client Module
+
+This module talks to the arXiv Atom API directly instead of going through the
+`arxiv` package. Query URLs are built by hand, the page size follows
+`max_results` so most searches are a single request, connections are pooled on
+one `requests.Session`, and responses are parsed incrementally with a pull XML
+parser that turns each `<entry>` into a `Paper` and drops it from the tree.
+
+API reference: https://info.arxiv.org/help/api/user-manual.html
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, List, Optional
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import search_engine
+from search_engine import Paper
+
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+MAX_PAGE_SIZE = 2000  # Largest slice the API returns per request
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+ARXIV = "{http://arxiv.org/schemas/atom}"
+OPENSEARCH = "{http://a9.com/-/spec/opensearch/1.1/}"
+
+SORT_BY = {
+    "relevance": "relevance",
+    "submittedDate": "submittedDate",
+    "lastUpdatedDate": "lastUpdatedDate"
+}
+
+EMAIL_DOMAIN_PATTERN = re.compile(r'[\w\.-]+@([\w\.-]+\.\w+)')
+
+
+class ArxivAPIError(Exception):
+    """Raised when the arXiv API returns an error status or an unexpectedly empty page"""
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+    @property
+    def retryable(self) -> bool:
+        """Server errors, throttling and empty pages may succeed on retry; other 4xx won't"""
+        return self.status_code is None or self.status_code == 429 or self.status_code >= 500
+
+
+def build_query_url(
+    query: str,
+    start: int = 0,
+    max_results: int = 10,
+    sort_by: str = "relevance",
+    base_url: str = ARXIV_API_URL
+) -> str:
+    """Build the API URL for one page of results"""
+    params = {
+        "search_query": query,
+        "start": start,
+        "max_results": max_results,
+        "sortBy": SORT_BY.get(sort_by, "relevance"),
+        "sortOrder": "descending"
+    }
+    return f"{base_url}?{urlencode(params)}"
+
+
+def affiliations_from_comment(comment: str) -> List[str]:
+    """Guess organisations from e-mail domains in an arXiv comment"""
+    affiliations = []
+    seen_domains = set()
+    for domain in EMAIL_DOMAIN_PATTERN.findall(comment):
+        if domain not in seen_domains:
+            org_name = domain.split('.')[0].upper() if '.' in domain else domain.upper()
+            if 'edu' in domain:
+                org_name = domain.split('.')[0].replace('-', ' ').title()
+            affiliations.append(org_name)
+            seen_domains.add(domain)
+    return affiliations
+
+
+def _parse_datetime(text: str) -> datetime:
+    """Parse an Atom timestamp such as 2016-05-26T17:59:46Z into a UTC datetime"""
+    return datetime.fromisoformat(text.strip().replace("Z", "+00:00")).astimezone(timezone.utc)
+
+
+def parse_entry(entry: ET.Element) -> Paper:
+    """Convert an Atom `<entry>` element into a Paper"""
+    authors = []
+    affiliations = []
+    comment = entry.findtext(f"{ARXIV}comment")
+    if comment:
+        affiliations.extend(affiliations_from_comment(comment))
+    for author in entry.iterfind(f"{ATOM}author"):
+        authors.append(author.findtext(f"{ATOM}name", "").strip())
+        for affiliation in author.iterfind(f"{ARXIV}affiliation"):
+            name = (affiliation.text or "").strip()
+            if name and name not in affiliations:
+                affiliations.append(name)
+    pdf_url = ""
+    for link in entry.iterfind(f"{ATOM}link"):
+        if link.get("title") == "pdf":
+            pdf_url = link.get("href", "")
+            break
+    published = entry.findtext(f"{ATOM}published")
+    return Paper(
+        title=" ".join(entry.findtext(f"{ATOM}title", "").split()),
+        authors=authors,
+        abstract=entry.findtext(f"{ATOM}summary", "").strip(),
+        published_date=_parse_datetime(published) if published else None,
+        url=entry.findtext(f"{ATOM}id", "").strip(),
+        pdf_url=pdf_url,
+        source="arXiv",
+        affiliations=affiliations
+    )
+
+
+class FeedParser:
+    """
+    Incremental Atom feed parser.
+
+    Feed it raw response chunks and it yields a Paper for every `<entry>` as soon
+    as its closing tag arrives. Parsed entries are removed from the tree, so
+    memory stays bounded by one entry plus the current chunk.
+    """
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._root: Optional[ET.Element] = None
+        self.total_results: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> Iterator[Paper]:
+        self._parser.feed(chunk)
+        return self._events()
+
+    def close(self) -> Iterator[Paper]:
+        self._parser.close()
+        return self._events()
+
+    def _events(self) -> Iterator[Paper]:
+        for event, element in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = element
+                continue
+            if element.tag == f"{ATOM}entry":
+                yield parse_entry(element)
+                self._root.remove(element)
+            elif element.tag == f"{OPENSEARCH}totalResults":
+                self.total_results = int(element.text or 0)
+
+
+def iter_feed(chunks: Iterable[bytes], parser: Optional[FeedParser] = None) -> Iterator[Paper]:
+    """Stream Papers out of an Atom feed delivered in chunks"""
+    parser = parser if parser is not None else FeedParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+class ArxivClient:
+    """
+    Minimal streaming client for the arXiv search API.
+
+    Requests are paced by `search_engine.ARXIV_RATE_LIMITER`, which batch
+    workers share across processes.
+    """
+    def __init__(
+        self,
+        base_url: str = ARXIV_API_URL,
+        timeout: float = 15.0,
+        num_retries: int = 3,
+        chunk_size: int = 64 * 1024,
+        pool_size: int = 4
+    ):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.num_retries = num_retries
+        self.chunk_size = chunk_size
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "paper-finder (https://github.com/rajan-sap/paper-finder)"
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def search(self, query: str, max_results: int = 10, sort_by: str = "relevance") -> Iterator[Paper]:
+        """
+        Yield up to `max_results` Papers for a query as they are parsed.
+
+        Pages are sized to the remaining results (capped at MAX_PAGE_SIZE). A
+        page that fails with a network, parse, 5xx or 429 error is retried from
+        the first entry not yet yielded; other 4xx responses raise immediately.
+        """
+        offset = 0
+        total_results = None
+        while offset < max_results and (total_results is None or offset < total_results):
+            page_start = offset
+            for attempt in range(self.num_retries + 1):
+                parser = FeedParser()
+                page_size = min(MAX_PAGE_SIZE, max_results - offset)
+                try:
+                    for paper in self._fetch_page(query, offset, page_size, sort_by, parser):
+                        offset += 1
+                        yield paper
+                    if offset == page_start and parser.total_results and page_start < parser.total_results:
+                        raise ArxivAPIError(f"Unexpectedly empty page at offset {page_start}")
+                    break
+                except (requests.RequestException, ET.ParseError, ArxivAPIError) as e:
+                    if attempt == self.num_retries or (isinstance(e, ArxivAPIError) and not e.retryable):
+                        raise
+            total_results = parser.total_results or 0
+            if offset == page_start:
+                break
+
+    def _fetch_page(self, query: str, start: int, page_size: int, sort_by: str, parser: FeedParser) -> Iterator[Paper]:
+        url = build_query_url(query, start, page_size, sort_by, self.base_url)
+        search_engine.ARXIV_RATE_LIMITER.wait()
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
+            if response.status_code != 200:
+                raise ArxivAPIError(f"arXiv API returned HTTP {response.status_code} for {url}", response.status_code)
+            yield from iter_feed(response.iter_content(chunk_size=self.chunk_size), parser)
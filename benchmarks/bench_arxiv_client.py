@@ -0,0 +1,101 @@
+"""
+Benchmark: streaming arXiv feed parsing vs. the `arxiv` package.
+
+Parses a recorded Atom feed with both code paths and reports wall time and
+peak traced memory. Pass a feed saved from the API, e.g.
+
+    curl -o feed.xml "https://export.arxiv.org/api/query?search_query=all:quantum&max_results=1000"
+    python benchmarks/bench_arxiv_client.py feed.xml
+
+Without an argument a synthetic feed in the same format is generated.
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arxiv_client import iter_feed
+
+ENTRY_TEMPLATE = """  <entry>
+    <id>http://arxiv.org/abs/2401.{n:05d}v1</id>
+    <updated>2024-01-02T10:00:00Z</updated>
+    <published>2024-01-01T10:00:00Z</published>
+    <title>Synthetic Paper {n} on Scalable
+      Retrieval Methods</title>
+    <summary>{summary}</summary>
+    <author><name>Author {n} A</name><arxiv:affiliation>University {n}</arxiv:affiliation></author>
+    <author><name>Author {n} B</name></author>
+    <arxiv:comment>12 pages; contact author{n}@example.edu</arxiv:comment>
+    <link href="http://arxiv.org/abs/2401.{n:05d}v1" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2401.{n:05d}v1" rel="related" type="application/pdf"/>
+    <arxiv:primary_category term="cs.IR" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.IR" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+"""
+
+
+def synthetic_feed(entries: int) -> bytes:
+    summary = " ".join(["We propose a method for retrieving relevant passages efficiently."] * 20)
+    body = "".join(ENTRY_TEMPLATE.format(n=n, summary=summary) for n in range(entries))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/" '
+        'xmlns:arxiv="http://arxiv.org/schemas/atom">\n'
+        f"  <opensearch:totalResults>{entries}</opensearch:totalResults>\n"
+        f"{body}</feed>\n"
+    ).encode("utf-8")
+
+
+def parse_with_arxiv_package(content: bytes):
+    """The parse step `arxiv.Client` runs for every page"""
+    import arxiv
+    if hasattr(arxiv, "_feed"):
+        return list(arxiv._feed.parse(content).results)
+    import feedparser
+    return [arxiv.Result._from_feed_entry(entry) for entry in feedparser.parse(content).entries]
+
+
+def parse_with_streaming_client(content: bytes, chunk_size: int = 64 * 1024):
+    chunks = (content[i:i + chunk_size] for i in range(0, len(content), chunk_size))
+    return list(iter_feed(chunks))
+
+
+def measure(name: str, parse, content: bytes, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = parse(content)
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<18} {len(results):>6} entries  best {min(timings) * 1000:8.1f} ms  peak {peak / 2**20:7.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("feed", nargs="?", help="Recorded arXiv API response (Atom XML)")
+    parser.add_argument("--entries", type=int, default=1000, help="Entries in the synthetic feed")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.feed:
+        with open(args.feed, "rb") as f:
+            content = f.read()
+    else:
+        content = synthetic_feed(args.entries)
+    print(f"Feed size: {len(content) / 2**20:.1f} MiB")
+    measure("streaming client", parse_with_streaming_client, content, args.repeat)
+    try:
+        measure("arxiv package", parse_with_arxiv_package, content, args.repeat)
+    except ImportError as e:
+        print(f"arxiv package path unavailable: {e}")
+
+
+if __name__ == "__main__":
+    main()
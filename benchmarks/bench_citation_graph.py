@@ -0,0 +1,60 @@
+"""
+Benchmark: citation graph construction and personalized PageRank.
+
+Builds a synthetic neighbourhood for a page of results (Semantic Scholar
+lookups are replaced by generated references and citations) and times the
+CSR layout and the power iteration:
+
+    python benchmarks/bench_citation_graph.py --results 50 --neighbors 800
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from citation_graph import CitationNeighborhood, build_citation_graph, personalized_pagerank
+
+
+def synthetic_neighborhoods(results: int, neighbors: int, pool: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    neighborhoods = []
+    for i in range(results):
+        linked = rng.integers(0, pool, size=neighbors)
+        split = neighbors // 4
+        neighborhoods.append(CitationNeighborhood(
+            paper_id=f"seed{i}",
+            references=tuple(f"n{j}" for j in linked[:split]),
+            citations=tuple(f"n{j}" for j in linked[split:])
+        ))
+    return neighborhoods
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--results", type=int, default=50)
+    parser.add_argument("--neighbors", type=int, default=800, help="References + citations per result")
+    parser.add_argument("--pool", type=int, default=40000, help="Distinct papers neighbours are drawn from")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    neighborhoods = synthetic_neighborhoods(args.results, args.neighbors, args.pool)
+    build_times, rank_times = [], []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        indptr, indices, seed_nodes, node_weights = build_citation_graph(neighborhoods)
+        built = time.perf_counter()
+        personalized_pagerank(indptr, indices, node_weights)
+        build_times.append(built - started)
+        rank_times.append(time.perf_counter() - built)
+    print(f"nodes {len(indptr) - 1}, edges {len(indices)}")
+    print(f"build graph   best {min(build_times) * 1000:7.1f} ms")
+    print(f"pagerank      best {min(rank_times) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: cold import time and first-request latency of the search backend.
+
+Each run starts a fresh interpreter, imports `search_engine`, and issues two
+searches against a local server that replays a recorded-format arXiv feed and
+Semantic Scholar responses, so the numbers exclude real network latency:
+
+    python benchmarks/bench_startup.py --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.bench_arxiv_client import synthetic_feed
+
+CHILD = """
+import sys, time, json
+started = time.perf_counter()
+import search_engine
+imported = time.perf_counter()
+from search_engine import ArxivSearchEngine, RateLimiter, SearchEngineFactory, search_papers
+search_engine.ARXIV_RATE_LIMITER = RateLimiter(0)
+search_engine.SEMANTIC_SCHOLAR_RATE_LIMITER = RateLimiter(0)
+search_engine.SEMANTIC_SCHOLAR_API_URL = "{base}/graph/v1"
+def build():
+    from arxiv_client import ArxivClient
+    return ArxivSearchEngine(ArxivClient(base_url="{base}/api/query"))
+SearchEngineFactory.register("arXiv", build)
+search_papers("all:retrieval", max_results=10)
+first = time.perf_counter()
+search_papers("all:retrieval", max_results=10)
+second = time.perf_counter()
+heavy = [name for name in ("requests", "numpy", "pandas", "arxiv") if name in sys.modules]
+print(json.dumps({{"import": imported - started, "first": first - imported, "warm": second - first, "loaded": heavy}}))
+"""
+
+
+def serve(feed: bytes) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            if self.path.startswith("/api/query"):
+                body, content_type = feed, "application/atom+xml"
+            else:
+                body, content_type = json.dumps({"citationCount": 3, "authors": []}).encode(), "application/json"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    server = serve(synthetic_feed(10))
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    samples = []
+    for _ in range(args.runs):
+        output = subprocess.run(
+            [sys.executable, "-c", CHILD.format(base=base)],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    server.shutdown()
+
+    for key, label in (("import", "import search_engine"), ("first", "first search"), ("warm", "warm search")):
+        values = [sample[key] * 1000 for sample in samples]
+        print(f"{label:<22} median {statistics.median(values):8.1f} ms  min {min(values):8.1f} ms")
+    print(f"heavy modules loaded after first search: {', '.join(samples[-1]['loaded']) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""
+Headless Bulk Search
+
+Runs many paper searches offline without the Solara UI. Queries are read lazily
+from a file or stdin, executed on a process pool that shares the API rate limits
+of `search_engine`, and streamed to JSONL or Parquet (the `parquet` extra) as
+they complete. Progress is checkpointed so an interrupted batch resumes where it
+stopped.
+
+Usage:
+    python bulk_search.py queries.txt -o results.jsonl --workers 4
+    cat queries.txt | python bulk_search.py - -o results.parquet --resume
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import search_engine
+from search_engine import Paper, RateLimiter, search_papers
+
+
+def read_queries(stream: TextIO) -> Iterator[Tuple[int, str]]:
+    """Yield (index, query) pairs, skipping blank lines and `#` comments"""
+    index = 0
+    for line in stream:
+        query = line.strip()
+        if not query or query.startswith("#"):
+            continue
+        yield index, query
+        index += 1
+
+
+def paper_record(paper: Paper) -> Dict[str, Any]:
+    """Flatten a Paper into a JSON/Parquet friendly record"""
+    record = asdict(paper)
+    if paper.published_date is not None:
+        record["published_date"] = paper.published_date.isoformat()
+    return record
+
+
+def run_query(
+    index: int,
+    query: str,
+    source: str,
+    max_results: int,
+    sort_by: str,
+    attempt: int = 1
+) -> Dict[str, Any]:
+    """
+    Execute one query; errors are reported in the record instead of raised.
+    `attempt` counts runs of this query across resumes, so readers can keep the
+    latest record per index and drop stale error records.
+    """
+    started = time.time()
+    try:
+        papers, criteria = search_papers(query, source=source, max_results=max_results, sort_by=sort_by)
+        return {
+            "index": index,
+            "attempt": attempt,
+            "query": query,
+            "papers": [paper_record(paper) for paper in papers],
+            "ranking_criteria": criteria.to_dict(),
+            "error": None,
+            "elapsed": time.time() - started
+        }
+    except Exception as e:
+        return {
+            "index": index,
+            "attempt": attempt,
+            "query": query,
+            "papers": [],
+            "ranking_criteria": None,
+            "error": str(e),
+            "elapsed": time.time() - started
+        }
+
+
+def _init_worker(shared_limits: Dict[str, Tuple[float, Any, Any]]):
+    """Rebind the module rate limiters to the ones shared by all workers"""
+    for name, (min_interval, lock, last_call) in shared_limits.items():
+        setattr(search_engine, name, RateLimiter(min_interval, lock, last_call))
+
+
+class Checkpoint:
+    """
+    Tracks which query indices have been written.
+
+    Stored as a low watermark (every index below it is settled) plus the few
+    settled indices above it, so the file and memory stay bounded by the
+    in-flight window rather than the batch size. Failed queries also advance
+    the watermark but are kept in `failed` with their number of attempts, so a
+    resumed batch runs them again; that map grows only with the number of
+    failures.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.watermark = 0
+        self.done_above: set = set()
+        self.failed: Dict[int, int] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "Checkpoint":
+        checkpoint = cls(path)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            checkpoint.watermark = state["watermark"]
+            checkpoint.done_above = set(state["done_above"])
+            checkpoint.failed = {int(index): attempts for index, attempts in state.get("failed", {}).items()}
+        return checkpoint
+
+    def is_done(self, index: int) -> bool:
+        return (index < self.watermark or index in self.done_above) and index not in self.failed
+
+    def attempt(self, index: int) -> int:
+        """Attempt number of the next run of a query"""
+        return self.failed.get(index, 0) + 1
+
+    def mark_done(self, indices: Iterable[int], failed: Iterable[int] = ()):
+        """Settle indices; those in `failed` stay eligible for the next resume"""
+        indices = set(indices)
+        failed = set(failed)
+        for index in indices:
+            if index in failed:
+                self.failed[index] = self.attempt(index)
+            else:
+                self.failed.pop(index, None)
+        self.done_above.update(index for index in indices if index >= self.watermark)
+        while self.watermark in self.done_above:
+            self.done_above.remove(self.watermark)
+            self.watermark += 1
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "watermark": self.watermark,
+                "done_above": sorted(self.done_above),
+                "failed": {str(index): self.failed[index] for index in sorted(self.failed)}
+            }, f)
+        os.replace(tmp_path, self.path)
+
+
+class JsonlWriter:
+    """
+    Appends one JSON line per query and flushes it immediately. Like
+    ParquetWriter, it refuses to overwrite existing results unless appending.
+    """
+    def __init__(self, path: str, append: bool):
+        if path == "-":
+            self._file = sys.stdout
+            return
+        if not append and os.path.exists(path) and os.path.getsize(path) > 0:
+            raise ValueError(f"Output file '{path}' already has results; use --resume or a new path")
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+
+    def write(self, record: Dict[str, Any]) -> bool:
+        """Write a record; returns True once it is durably flushed"""
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        return True
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if self._file is not sys.stdout:
+            self._file.close()
+
+
+class ParquetWriter:
+    """
+    Writes one row per (query, paper) into a directory of Parquet part files.
+
+    Rows are buffered up to `batch_size` and each flush writes a new part file,
+    so resuming a batch only adds parts and never rewrites existing ones. Every
+    part uses the same fixed schema, so the directory reads back as one table.
+    Requires pyarrow, which is imported here so a missing install fails before
+    any query runs.
+    """
+    def __init__(self, path: str, append: bool, batch_size: int = 500):
+        import pyarrow as pa
+        self.path = path
+        self.batch_size = batch_size
+        self.schema = pa.schema([
+            ("query_index", pa.int64()),
+            ("attempt", pa.int64()),
+            ("query", pa.string()),
+            ("error", pa.string()),
+            ("rank", pa.int64()),
+            ("title", pa.string()),
+            ("authors", pa.list_(pa.string())),
+            ("abstract", pa.string()),
+            ("published_date", pa.string()),
+            ("url", pa.string()),
+            ("source", pa.string()),
+            ("pdf_url", pa.string()),
+            ("citation_count", pa.int64()),
+            ("relevance_score", pa.float64()),
+            ("affiliations", pa.list_(pa.string())),
+        ])
+        self._rows: List[Dict[str, Any]] = []
+        os.makedirs(path, exist_ok=True)
+        existing = [name for name in os.listdir(path) if name.endswith(".parquet")]
+        if existing and not append:
+            raise ValueError(f"Output directory '{path}' already has Parquet parts; use --resume or a new path")
+        self._part = len(existing)
+
+    def write(self, record: Dict[str, Any]) -> bool:
+        base = {
+            "query_index": record["index"],
+            "attempt": record["attempt"],
+            "query": record["query"],
+            "error": record["error"]
+        }
+        if not record["papers"]:
+            self._rows.append({**base, "rank": None})
+        for rank, paper in enumerate(record["papers"]):
+            self._rows.append({**base, "rank": rank, **paper})
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+            return True
+        return False
+
+    def flush(self):
+        if not self._rows:
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        part_path = os.path.join(self.path, f"part-{self._part:05d}.parquet")
+        pq.write_table(pa.Table.from_pylist(self._rows, schema=self.schema), part_path)
+        self._part += 1
+        self._rows = []
+
+    def close(self):
+        self.flush()
+
+
+def run_batch(
+    queries: Iterable[Tuple[int, str]],
+    writer,
+    checkpoint: Checkpoint,
+    source: str = "arXiv",
+    max_results: int = 20,
+    sort_by: str = "relevance",
+    workers: int = 4,
+    progress: Optional[TextIO] = sys.stderr
+) -> Dict[str, int]:
+    """
+    Run queries on a process pool and stream their records to `writer`.
+
+    At most `2 * workers` queries are in flight at once, so memory does not grow
+    with the number of queries. With `workers <= 1` queries run in this process.
+    """
+    stats = {"done": 0, "failed": 0, "skipped": 0}
+    pending_indices: List[int] = []
+    pending_failed: List[int] = []
+    started = time.time()
+
+    def handle(record: Dict[str, Any]):
+        nonlocal pending_indices, pending_failed
+        pending_indices.append(record["index"])
+        if record["error"]:
+            pending_failed.append(record["index"])
+        if writer.write(record):
+            checkpoint.mark_done(pending_indices, failed=pending_failed)
+            checkpoint.save()
+            pending_indices, pending_failed = [], []
+        stats["done"] += 1
+        if record["error"]:
+            stats["failed"] += 1
+        if progress is not None:
+            rate = stats["done"] / max(time.time() - started, 1e-9)
+            status = f"error: {record['error']}" if record["error"] else f"{len(record['papers'])} papers"
+            progress.write(f"[{stats['done']} done, {stats['failed']} failed, {rate:.2f} q/s] "
+                           f"#{record['index']} {record['query']!r}: {status}\n")
+
+    def remaining() -> Iterator[Tuple[int, str, int]]:
+        for index, query in queries:
+            if checkpoint.is_done(index):
+                stats["skipped"] += 1
+                continue
+            yield index, query, checkpoint.attempt(index)
+
+    if workers <= 1:
+        for index, query, attempt in remaining():
+            handle(run_query(index, query, source, max_results, sort_by, attempt))
+    else:
+        context = multiprocessing.get_context()
+        shared_limits = {
+            name: (getattr(search_engine, name).min_interval, context.Lock(), context.Value("d", 0.0))
+            for name in ("ARXIV_RATE_LIMITER", "SEMANTIC_SCHOLAR_RATE_LIMITER")
+        }
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(shared_limits,)
+        ) as pool:
+            in_flight = set()
+            for index, query, attempt in remaining():
+                in_flight.add(pool.submit(run_query, index, query, source, max_results, sort_by, attempt))
+                if len(in_flight) >= 2 * workers:
+                    finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        handle(future.result())
+            while in_flight:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    handle(future.result())
+
+    writer.close()
+    if pending_indices:
+        checkpoint.mark_done(pending_indices, failed=pending_failed)
+    checkpoint.save()
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run paper searches in bulk without the web UI")
+    parser.add_argument("queries", help="File with one query per line, or '-' for stdin")
+    parser.add_argument("-o", "--output", default="-",
+                        help="Output path; '.parquet' writes a directory of Parquet parts, anything else JSONL ('-' for stdout)")
+    parser.add_argument("--format", choices=["jsonl", "parquet"], help="Output format (default: from output extension)")
+    parser.add_argument("--source", default="arXiv")
+    parser.add_argument("--max-results", type=int, default=20)
+    parser.add_argument("--sort-by", default="relevance",
+                        choices=["relevance", "submittedDate", "lastUpdatedDate", "citations", "pagerank"])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint.json)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip queries that succeeded per the checkpoint, rerun failed ones, and append output; "
+                             "a rerun query gets a new record with a higher 'attempt', so keep the last record per index")
+    parser.add_argument("--quiet", action="store_true", help="Disable progress output on stderr")
+    args = parser.parse_args(argv)
+
+    output_format = args.format or ("parquet" if args.output.endswith(".parquet") else "jsonl")
+    if output_format == "parquet" and args.output == "-":
+        parser.error("Parquet output needs a path")
+    checkpoint_path = args.checkpoint or (
+        f"{args.output}.checkpoint.json" if args.output != "-" else "bulk_search.checkpoint.json"
+    )
+    checkpoint = Checkpoint.load(checkpoint_path) if args.resume else Checkpoint(checkpoint_path)
+
+    # Open the queries before the output so a bad path never truncates results
+    try:
+        stream = sys.stdin if args.queries == "-" else open(args.queries, "r", encoding="utf-8")
+    except OSError as e:
+        parser.error(f"Cannot read queries: {e}")
+    try:
+        try:
+            if output_format == "parquet":
+                writer = ParquetWriter(args.output, append=args.resume)
+            else:
+                writer = JsonlWriter(args.output, append=args.resume)
+        except ImportError:
+            parser.error("Parquet output needs pyarrow: install the 'parquet' extra (uv sync --extra parquet)")
+        except (ValueError, OSError) as e:
+            parser.error(str(e))
+        stats = run_batch(
+            read_queries(stream),
+            writer,
+            checkpoint,
+            source=args.source,
+            max_results=args.max_results,
+            sort_by=args.sort_by,
+            workers=args.workers,
+            progress=None if args.quiet else sys.stderr
+        )
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    if not args.quiet:
+        sys.stderr.write(f"Finished: {stats['done']} run, {stats['failed']} failed, {stats['skipped']} skipped\n")
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
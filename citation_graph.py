@@ -0,0 +1,230 @@
+"""
+Citation Graph Ranking Module
+
+This module ranks search results by their position in the local citation
+graph. References and citations of the top results are fetched from Semantic
+Scholar in batches (and cached), the neighbourhood is laid out as CSR arrays,
+and a personalized PageRank is computed with vectorized NumPy power iteration.
+
+Only the results' own neighbourhoods are fetched, so papers outside the result
+set carry teleport mass alone: a result's score reflects how many papers cite
+it, plus citations among the results, where a citation from a more relevant
+or better-cited result counts more.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+import search_engine
+from search_engine import Paper, normalize_arxiv_id
+
+BATCH_SIZE = 500  # Largest ID list the Semantic Scholar batch endpoint accepts
+CACHE_MAX_IDS = 500_000  # Total paper IDs held by the neighbourhood cache
+
+
+class CitationNeighborhood(NamedTuple):
+    """
+    Semantic Scholar IDs of a paper and of the papers it cites and is cited by.
+    `citation_count` is the full number of citers, which can exceed
+    `len(citations)` when Semantic Scholar truncates the list.
+    """
+    paper_id: str
+    references: Tuple[str, ...]
+    citations: Tuple[str, ...]
+    citation_count: int = 0
+
+
+_neighborhood_cache: "OrderedDict[str, Optional[CitationNeighborhood]]" = OrderedDict()
+_cache_ids = 0
+_cache_lock = threading.Lock()
+
+
+def _link_ids(links: Optional[list]) -> Tuple[str, ...]:
+    # IDs are interned so papers shared between neighbourhoods are stored once
+    return tuple(sys.intern(link["paperId"]) for link in links or [] if link.get("paperId"))
+
+
+def _parse_neighborhood(data: Optional[dict]) -> Optional[CitationNeighborhood]:
+    if not data or not data.get("paperId"):
+        return None
+    return CitationNeighborhood(
+        paper_id=sys.intern(data["paperId"]),
+        references=_link_ids(data.get("references")),
+        citations=_link_ids(data.get("citations")),
+        citation_count=data.get("citationCount") or 0
+    )
+
+
+def _cache_cost(neighborhood: Optional[CitationNeighborhood]) -> int:
+    if neighborhood is None:
+        return 1
+    return 1 + len(neighborhood.references) + len(neighborhood.citations)
+
+
+def _cache_neighborhoods(fetched: Dict[str, Optional[CitationNeighborhood]]):
+    """Add neighbourhoods to the cache, evicting the least recently used beyond CACHE_MAX_IDS"""
+    global _cache_ids
+    with _cache_lock:
+        for arxiv_id, neighborhood in fetched.items():
+            if arxiv_id in _neighborhood_cache:
+                _cache_ids -= _cache_cost(_neighborhood_cache.pop(arxiv_id))
+            _neighborhood_cache[arxiv_id] = neighborhood
+            _cache_ids += _cache_cost(neighborhood)
+        while _cache_ids > CACHE_MAX_IDS and _neighborhood_cache:
+            _cache_ids -= _cache_cost(_neighborhood_cache.popitem(last=False)[1])
+
+
+def fetch_citation_neighborhoods(arxiv_ids: Iterable[str]) -> Dict[str, Optional[CitationNeighborhood]]:
+    """
+    Fetch neighbourhoods for arXiv IDs with the Semantic Scholar batch endpoint.
+    Papers Semantic Scholar doesn't know map to None; failed batches are left out
+    and not cached, so they are retried on the next ranking.
+    """
+    arxiv_ids = list(dict.fromkeys(normalize_arxiv_id(arxiv_id) for arxiv_id in arxiv_ids))
+    results: Dict[str, Optional[CitationNeighborhood]] = {}
+    with _cache_lock:
+        for arxiv_id in arxiv_ids:
+            if arxiv_id in _neighborhood_cache:
+                _neighborhood_cache.move_to_end(arxiv_id)
+                results[arxiv_id] = _neighborhood_cache[arxiv_id]
+    missing = [arxiv_id for arxiv_id in arxiv_ids if arxiv_id not in results]
+    for start in range(0, len(missing), BATCH_SIZE):
+        batch = missing[start:start + BATCH_SIZE]
+        try:
+            search_engine.SEMANTIC_SCHOLAR_RATE_LIMITER.wait()
+            response = search_engine.get_semantic_scholar_session().post(
+                f"{search_engine.SEMANTIC_SCHOLAR_API_URL}/paper/batch",
+                params={"fields": "paperId,citationCount,references.paperId,citations.paperId"},
+                json={"ids": [f"arXiv:{arxiv_id}" for arxiv_id in batch]},
+                timeout=10
+            )
+            if response.status_code != 200:
+                continue
+            fetched = dict(zip(batch, (_parse_neighborhood(item) for item in response.json())))
+        except Exception:
+            continue
+        results.update(fetched)
+        _cache_neighborhoods(fetched)
+    return results
+
+
+def build_csr(sources: np.ndarray, targets: np.ndarray, num_nodes: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Deduplicated CSR adjacency (indptr, indices) for directed edges source -> target"""
+    keys = np.unique(sources.astype(np.int64) * num_nodes + targets)
+    sources, indices = np.divmod(keys, num_nodes)
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=indptr[1:])
+    return indptr, indices
+
+
+def build_citation_graph(
+    neighborhoods: List[Optional[CitationNeighborhood]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Lay out the union of the neighbourhoods as a CSR graph where an edge points
+    from a citing paper to the cited one. Returns (indptr, indices, seed_nodes,
+    node_weights); seed_nodes[i] is the node of neighborhoods[i], or -1 when it
+    is missing.
+
+    Citers beyond a truncated citation list are folded into one extra node per
+    paper whose weight is their number. Their own citations are unknown either
+    way, so in PageRank that node sends the paper as much mass as the missing
+    citers would one by one. Every other node has weight 1.
+    """
+    node_ids: Dict[str, int] = {}
+    unlisted: Dict[int, int] = {}
+    seed_nodes = np.full(len(neighborhoods), -1, dtype=np.int64)
+    for i, neighborhood in enumerate(neighborhoods):
+        if neighborhood is not None:
+            seed_nodes[i] = node_ids.setdefault(neighborhood.paper_id, len(node_ids))
+    sources: List[int] = []
+    targets: List[int] = []
+    for neighborhood in neighborhoods:
+        if neighborhood is None:
+            continue
+        node = node_ids[neighborhood.paper_id]
+        for ref in neighborhood.references:
+            sources.append(node)
+            targets.append(node_ids.setdefault(ref, len(node_ids)))
+        for cite in neighborhood.citations:
+            sources.append(node_ids.setdefault(cite, len(node_ids)))
+            targets.append(node)
+        missing = neighborhood.citation_count - len(neighborhood.citations)
+        unlisted_key = f"{neighborhood.paper_id}#unlisted-citers"
+        if missing > 0 and unlisted_key not in node_ids:
+            unlisted_node = node_ids.setdefault(unlisted_key, len(node_ids))
+            unlisted[unlisted_node] = missing
+            sources.append(unlisted_node)
+            targets.append(node)
+    indptr, indices = build_csr(
+        np.asarray(sources, dtype=np.int64),
+        np.asarray(targets, dtype=np.int64),
+        len(node_ids)
+    )
+    node_weights = np.ones(len(node_ids))
+    node_weights[list(unlisted)] = list(unlisted.values())
+    return indptr, indices, seed_nodes, node_weights
+
+
+def personalized_pagerank(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    personalization: np.ndarray,
+    damping: float = 0.85,
+    tol: float = 1e-9,
+    max_iter: int = 100
+) -> np.ndarray:
+    """
+    Power iteration over a CSR graph. Dangling nodes and the teleport step both
+    redistribute mass according to `personalization` (which is normalised here).
+    """
+    num_nodes = len(indptr) - 1
+    personalization = personalization / personalization.sum()
+    out_degree = np.diff(indptr)
+    edge_sources = np.repeat(np.arange(num_nodes), out_degree)
+    edge_weights = 1.0 / out_degree[edge_sources]
+    dangling = out_degree == 0
+    scores = personalization.copy()
+    for _ in range(max_iter):
+        updated = damping * np.bincount(indices, weights=scores[edge_sources] * edge_weights, minlength=num_nodes)
+        updated += (damping * scores[dangling].sum() + 1.0 - damping) * personalization
+        converged = np.abs(updated - scores).sum() < tol
+        scores = updated
+        if converged:
+            break
+    return scores
+
+
+def citation_graph_scores(
+    papers: List[Paper],
+    fetch: Callable[[Iterable[str]], Dict[str, Optional[CitationNeighborhood]]] = fetch_citation_neighborhoods,
+    seed_weight: float = 0.5
+) -> Tuple[List[float], int]:
+    """
+    Personalized PageRank score of each paper within the citation neighbourhood
+    of all of them. Half of the teleport mass goes to the results in proportion
+    to their relevance, the rest is spread evenly over every paper in the
+    neighbourhood (including citers beyond truncated lists) so that citations
+    from outside the result set count. Papers unknown to Semantic Scholar (or
+    whose batch failed) score 0.
+
+    Returns the scores and the number of papers that had citation data.
+    """
+    arxiv_ids = [normalize_arxiv_id(paper.url) for paper in papers]
+    fetched = fetch(arxiv_ids)
+    indptr, indices, seed_nodes, node_weights = build_citation_graph(
+        [fetched.get(arxiv_id) for arxiv_id in arxiv_ids]
+    )
+    num_nodes = len(indptr) - 1
+    known = seed_nodes >= 0
+    if num_nodes == 0:
+        return [0.0] * len(papers), 0
+    personalization = (1.0 - seed_weight) * node_weights / node_weights.sum()
+    relevance = np.array([max(paper.relevance_score, 1e-6) for paper in papers])[known]
+    np.add.at(personalization, seed_nodes[known], seed_weight * relevance / relevance.sum())
+    scores = personalized_pagerank(indptr, indices, personalization)
+    return [float(scores[node]) if node >= 0 else 0.0 for node in seed_nodes], int(known.sum())
@@ -0,0 +1,29 @@
+import solara
+
+FACET_LABELS = [("year", "Year"), ("author", "Authors"), ("affiliation", "Affiliations")]
+
+@solara.component
+def FacetPanel(facet_counts, selection, on_toggle):
+    with solara.Card(style={
+        "padding": "22px 20px",
+        "border-radius": "20px",
+        "box-shadow": "0 6px 32px rgba(59, 130, 246, 0.13)",
+        "background": "#f8fafc",
+        "border": "1.5px solid #c7d2fe",
+        "margin": "18px 0",
+        "min-width": "240px",
+        "max-width": "280px"
+    }):
+        solara.HTML(tag="h3", unsafe_innerHTML="Refine results", style={"font-size": "1.15rem", "color": "#1e293b", "margin": "0 0 10px 0", "font-weight": "700"})
+        for facet, label in FACET_LABELS:
+            values = facet_counts.get(facet, [])
+            if not values:
+                continue
+            solara.HTML(tag="h4", unsafe_innerHTML=label, style={"font-size": "1rem", "color": "#2563eb", "margin": "14px 0 4px 0", "font-weight": "700"})
+            for value, count in values:
+                solara.Checkbox(
+                    label=f"{value} ({count})",
+                    value=value in selection.get(facet, ()),
+                    on_value=lambda _checked, facet=facet, value=value: on_toggle(facet, value),
+                    style={"margin": "0", "color": "#334155" if count else "#94a3b8"}
+                )
@@ -3,6 +3,7 @@ import solara
 import html
 from solara import use_state
 from search_engine import Paper
+from components.paper_chat_modal import PaperChatModal
 
 
 
@@ -62,6 +63,12 @@ def SearchCard(paper: Paper):
                 style={"color": "#334155", "font-size": "1.01rem", "flex": "1 1 180px"}
             )
         show_full_abstract, set_show_full_abstract = use_state(False)
+        chat_open, set_chat_open = use_state(False)
+        chat_history, set_chat_history = use_state([])
+        def send_chat_message(message):
+            # Retrieval pulls in numpy, so load it on the first chat message rather than at startup
+            from paper_retrieval import paper_chat_backend
+            paper_chat_backend.send_handler(paper, chat_history, set_chat_history)(message)
         def get_truncated_abstract(text, max_sentences=3):
             # Try splitting by line breaks, then by period if needed
             lines = text.split(".")
@@ -100,6 +107,12 @@ def SearchCard(paper: Paper):
                         "border": "none"
                     }
                 )
+                solara.Button(
+                    label="Chat",
+                    icon_name="mdi-chat-outline",
+                    on_click=lambda: set_chat_open(True),
+                    style={"font-size": "0.98rem", "color": "#2563eb", "background": "#e0e7ff", "border-radius": "6px", "padding": "2px 14px", "box-shadow": "none", "border": "none"}
+                )
         else:
             truncated = get_truncated_abstract(paper.abstract)
             solara.HTML(
@@ -136,3 +149,16 @@ def SearchCard(paper: Paper):
                         "border": "none"
                     }
                 )
+                solara.Button(
+                    label="Chat",
+                    icon_name="mdi-chat-outline",
+                    on_click=lambda: set_chat_open(True),
+                    style={"font-size": "0.98rem", "color": "#2563eb", "background": "#e0e7ff", "border-radius": "6px", "padding": "2px 14px", "box-shadow": "none", "border": "none"}
+                )
+        PaperChatModal(
+            open=chat_open,
+            on_close=lambda: set_chat_open(False),
+            paper_title=paper.title,
+            chat_history=chat_history,
+            on_send=send_chat_message
+        )
\ No newline at end of file
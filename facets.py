@@ -0,0 +1,99 @@
+"""
+Faceted Filtering Module
+
+This module narrows a result set by year, author and affiliation without new
+requests. Every facet value keeps a bitmap (a Python int, bit i set when result
+i has the value), so filtering is a few ORs and ANDs and counting is a popcount
+per value. The index is built once per search, after enrichment.
+"""
+
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+from search_engine import Paper
+
+T = TypeVar("T")
+
+Selection = Mapping[str, Iterable[str]]
+
+FACET_EXTRACTORS: Dict[str, Callable[[Paper], Iterable[str]]] = {
+    "year": lambda paper: [str(paper.published_date.year)] if paper.published_date else [],
+    "author": lambda paper: paper.authors,
+    "affiliation": lambda paper: paper.affiliations,
+}
+
+
+class FacetIndex:
+    """Per-facet value bitmaps over an ordered result set"""
+    def __init__(self, extractors: Optional[Dict[str, Callable[[Paper], Iterable[str]]]] = None):
+        self.extractors = extractors if extractors is not None else FACET_EXTRACTORS
+        self.size = 0
+        self._bitmaps: Dict[str, Dict[str, int]] = {facet: {} for facet in self.extractors}
+
+    def add(self, papers: Iterable[Paper]):
+        """Append results after the ones already indexed"""
+        for paper in papers:
+            bit = 1 << self.size
+            for facet, extract in self.extractors.items():
+                bitmaps = self._bitmaps[facet]
+                for value in extract(paper):
+                    bitmaps[value] = bitmaps.get(value, 0) | bit
+            self.size += 1
+
+    def mask(self, selection: Selection, exclude: Optional[str] = None) -> int:
+        """
+        Bitmap of results matching the selection: any selected value within a
+        facet, all facets with a selection. `exclude` ignores one facet's selection.
+        """
+        matched = (1 << self.size) - 1
+        for facet, values in selection.items():
+            if facet == exclude or not values:
+                continue
+            bitmaps = self._bitmaps[facet]
+            facet_mask = 0
+            for value in values:
+                facet_mask |= bitmaps.get(value, 0)
+            matched &= facet_mask
+        return matched
+
+    def counts(self, selection: Selection, limit: Optional[int] = None) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        Value counts per facet under the selection of the other facets, so
+        toggling values within a facet never hides its siblings. Years are
+        listed newest first, other facets by count; selected values are always
+        kept when `limit` truncates a facet.
+        """
+        counts = {}
+        for facet, bitmaps in self._bitmaps.items():
+            base = self.mask(selection, exclude=facet)
+            facet_counts = [(value, (bitmap & base).bit_count()) for value, bitmap in bitmaps.items()]
+            if facet == "year":
+                facet_counts.sort(key=lambda item: item[0], reverse=True)
+            else:
+                facet_counts.sort(key=lambda item: (-item[1], item[0]))
+            if limit is not None and len(facet_counts) > limit:
+                selected = set(selection.get(facet, ()))
+                facet_counts = [
+                    item for i, item in enumerate(facet_counts) if i < limit or item[0] in selected
+                ]
+            counts[facet] = facet_counts
+        return counts
+
+    def filter(self, items: Sequence[T], selection: Selection) -> List[T]:
+        """The items (aligned with the indexed results) that match the selection"""
+        matched = self.mask(selection)
+        if matched == (1 << self.size) - 1:
+            return list(items)
+        selected = []
+        while matched:
+            lowest = matched & -matched
+            selected.append(items[lowest.bit_length() - 1])
+            matched ^= lowest
+        return selected
+
+
+def toggle_selection(selection: Selection, facet: str, value: str) -> Dict[str, frozenset]:
+    """A new selection with one facet value switched on or off"""
+    updated = {name: frozenset(values) for name, values in selection.items()}
+    values = updated.get(facet, frozenset())
+    updated[facet] = values - {value} if value in values else values | {value}
+    return updated
@@ -0,0 +1,213 @@
+"""
+Paper Retrieval Module
+
+This module provides low-latency passage retrieval for the paper chat dialog.
+A paper's abstract (plus full text, for callers that have it) is split into overlapping
+chunks which are indexed once per paper with a precomputed BM25 weight matrix
+over hashed term buckets. Answering a chat message is then a column gather and
+a row sum over that matrix.
+"""
+
+import hashlib
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from search_engine import Paper
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the "
+    "this to was we were which with what how why who does do our their these".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with stopwords removed"""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def chunk_text(text: str, chunk_words: int = 80, overlap_sentences: int = 1) -> List[str]:
+    """
+    Split text into chunks of whole sentences holding roughly `chunk_words` words.
+    Consecutive chunks share `overlap_sentences` sentences so an answer spanning a
+    chunk boundary is still retrievable.
+    """
+    sentences = [s.strip() for s in SENTENCE_PATTERN.split(" ".join(text.split())) if s.strip()]
+    chunks = []
+    current: List[str] = []
+    current_words = 0
+    for sentence in sentences:
+        words = len(sentence.split())
+        if current and current_words + words > chunk_words:
+            chunks.append(" ".join(current))
+            current = current[-overlap_sentences:] if overlap_sentences > 0 else []
+            current_words = sum(len(s.split()) for s in current)
+        current.append(sentence)
+        current_words += words
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+@dataclass
+class Passage:
+    """A retrieved chunk of a paper with its BM25 score"""
+    text: str
+    score: float
+    chunk_index: int
+
+
+class PaperIndex:
+    """
+    BM25 index over the chunks of a single paper.
+
+    Terms are hashed into `dimensions` buckets so the whole index is one dense
+    float32 matrix of shape (chunks, dimensions) holding the final BM25 weight of
+    every bucket in every chunk.
+    """
+    def __init__(
+        self,
+        chunks: List[str],
+        dimensions: int = 1024,
+        k1: float = 1.5,
+        b: float = 0.75
+    ):
+        self.chunks = chunks
+        self.dimensions = dimensions
+        term_frequencies = np.zeros((len(chunks), dimensions), dtype=np.float32)
+        for row, chunk in enumerate(chunks):
+            term_frequencies[row] = np.bincount(self._buckets(tokenize(chunk)), minlength=dimensions)
+        chunk_lengths = term_frequencies.sum(axis=1)
+        average_length = chunk_lengths.mean() if len(chunks) else 0.0
+        document_frequencies = np.count_nonzero(term_frequencies, axis=0)
+        idf = np.log1p((len(chunks) - document_frequencies + 0.5) / (document_frequencies + 0.5))
+        if average_length > 0:
+            norms = k1 * (1.0 - b + b * chunk_lengths / average_length)
+        else:
+            norms = np.full(len(chunks), k1, dtype=np.float32)
+        self.weights = (
+            idf * term_frequencies * (k1 + 1.0) / (term_frequencies + norms[:, None])
+        ).astype(np.float32)
+
+    def _buckets(self, tokens: List[str]) -> np.ndarray:
+        """Map tokens to stable hash buckets"""
+        return np.fromiter(
+            (zlib.crc32(token.encode("utf-8")) % self.dimensions for token in tokens),
+            dtype=np.intp,
+            count=len(tokens)
+        )
+
+    def search(self, query: str, top_k: int = 3) -> List[Passage]:
+        """Return the `top_k` highest scoring chunks for the query"""
+        buckets = self._buckets(tokenize(query))
+        if not self.chunks or buckets.size == 0:
+            return []
+        unique_buckets, counts = np.unique(buckets, return_counts=True)
+        scores = self.weights[:, unique_buckets] @ counts.astype(np.float32)
+        top_k = min(top_k, len(self.chunks))
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [
+            Passage(text=self.chunks[i], score=float(scores[i]), chunk_index=int(i))
+            for i in ranked
+            if scores[i] > 0
+        ]
+
+
+class PaperIndexCache:
+    """
+    Thread-safe LRU cache of per-paper indexes shared by all open chats.
+
+    Indexes are keyed by the paper and a hash of the full text they were built
+    from, so the abstract-only index and indexes over different full texts of
+    the same paper never stand in for each other.
+    """
+    def __init__(self, max_papers: int = 64, dimensions: int = 1024):
+        self.max_papers = max_papers
+        self.dimensions = dimensions
+        self._indexes: "OrderedDict[Tuple[str, Optional[str]], PaperIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def get(self, paper: Paper, full_text: Optional[str] = None) -> PaperIndex:
+        """Return the index for a paper (and full text, if any), building it on first use"""
+        text_hash = hashlib.sha1(full_text.encode("utf-8")).hexdigest() if full_text else None
+        key = (paper.url or paper.title, text_hash)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+                return index
+        text = paper.abstract if not full_text else f"{paper.abstract}\n{full_text}"
+        index = PaperIndex(chunk_text(f"{paper.title}. {text}"), dimensions=self.dimensions)
+        with self._lock:
+            self._indexes[key] = index
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self.max_papers:
+                self._indexes.popitem(last=False)
+        return index
+
+
+AnswerGenerator = Callable[[str, List[Passage], Paper], str]
+
+
+def extractive_answer(question: str, passages: List[Passage], paper: Paper) -> str:
+    """Default answer generator: quote the best matching passages"""
+    if not passages:
+        return f"I couldn't find anything about that in \"{paper.title}\"."
+    return " ... ".join(passage.text for passage in passages)
+
+
+class PaperChatBackend:
+    """
+    Retrieval backend behind `PaperChatModal.on_send`.
+
+    Retrieves the top passages for a message and hands them to a pluggable
+    local answer generator.
+    """
+    def __init__(
+        self,
+        generator: AnswerGenerator = extractive_answer,
+        cache: Optional[PaperIndexCache] = None,
+        top_k: int = 3
+    ):
+        self.generator = generator
+        self.cache = cache if cache is not None else PaperIndexCache()
+        self.top_k = top_k
+
+    def retrieve(self, paper: Paper, message: str, full_text: Optional[str] = None) -> List[Passage]:
+        """Top passages of the paper for a chat message"""
+        return self.cache.get(paper, full_text).search(message, self.top_k)
+
+    def reply(self, paper: Paper, message: str, full_text: Optional[str] = None) -> str:
+        """Answer a chat message about the paper"""
+        passages = self.retrieve(paper, message, full_text)
+        return self.generator(message, passages, paper)
+
+    def send_handler(
+        self,
+        paper: Paper,
+        chat_history: List[Dict[str, str]],
+        set_chat_history: Callable[[List[Dict[str, str]]], None]
+    ) -> Callable[[str], None]:
+        """Build an `on_send` callback that appends the exchange to the chat history"""
+        def on_send(message: str):
+            answer = self.reply(paper, message)
+            set_chat_history(chat_history + [
+                {"role": "user", "content": message},
+                {"role": "assistant", "content": answer}
+            ])
+        return on_send
+
+
+# Process-wide backend so indexes are shared across sessions
+paper_chat_backend = PaperChatBackend()
@@ -0,0 +1,155 @@
+"""
+Shared Paper Store Module
+
+This module keeps one process-wide copy of every paper shown to any session.
+Records are interned by arXiv ID and reference-counted per session; sessions
+hold only lightweight `PaperRef` lists. Unreferenced records stay cached for
+later searches until the store exceeds its memory budget, then the least
+recently used ones are evicted.
+"""
+
+import dataclasses
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from search_engine import Paper, normalize_arxiv_id
+
+RECORD_OVERHEAD_BYTES = 600  # Paper instance, tuples and ints around the strings
+
+
+class PaperRef(NamedTuple):
+    """A session's handle on a stored paper plus its per-query relevance"""
+    paper_id: str
+    relevance_score: float
+
+
+def paper_id_for(paper: Paper) -> str:
+    """Store key for a paper: its bare arXiv ID, falling back to the URL or title"""
+    if paper.url:
+        return normalize_arxiv_id(paper.url) if 'arxiv.org' in paper.url else paper.url
+    return paper.title
+
+
+def _freeze(paper: Paper) -> Paper:
+    """Copy a paper with tuple fields and no query-specific score, to be shared read-only"""
+    return dataclasses.replace(
+        paper,
+        authors=tuple(paper.authors),
+        affiliations=tuple(paper.affiliations),
+        relevance_score=0.0
+    )
+
+
+def _record_size(paper: Paper) -> int:
+    """Approximate memory held by a frozen record"""
+    strings = [paper.title, paper.abstract, paper.url, paper.pdf_url, *paper.authors, *paper.affiliations]
+    return RECORD_OVERHEAD_BYTES + sum(sys.getsizeof(s) for s in strings if s)
+
+
+class _Entry:
+    __slots__ = ("paper", "size", "refs")
+
+    def __init__(self, paper: Paper, size: int):
+        self.paper = paper
+        self.size = size
+        self.refs = 0
+
+
+class PaperStore:
+    """
+    Thread-safe interned paper records shared by all sessions.
+
+    Records referenced by a session are never evicted, so the budget can be
+    exceeded while every record is in use; it bounds the cache of papers no
+    session is currently showing.
+    """
+    def __init__(self, memory_budget: int = 128 * 2**20):
+        self.memory_budget = memory_budget
+        self.total_bytes = 0
+        self._entries: Dict[str, _Entry] = {}
+        self._unreferenced: "OrderedDict[str, None]" = OrderedDict()
+        self._sessions: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, paper_id: str) -> bool:
+        return paper_id in self._entries
+
+    def _intern(self, paper: Paper) -> str:
+        """Store the latest version of a paper; caller holds the lock"""
+        paper_id = paper_id_for(paper)
+        record = _freeze(paper)
+        size = _record_size(record)
+        entry = self._entries.get(paper_id)
+        if entry is None:
+            entry = self._entries[paper_id] = _Entry(record, size)
+            self._unreferenced[paper_id] = None
+            self.total_bytes += size
+        else:
+            # Records are immutable; fresher enrichment data replaces the record
+            self.total_bytes += size - entry.size
+            entry.paper, entry.size = record, size
+            if entry.refs == 0:
+                self._unreferenced.move_to_end(paper_id)
+        return paper_id
+
+    def _acquire(self, paper_id: str):
+        entry = self._entries[paper_id]
+        entry.refs += 1
+        if entry.refs == 1:
+            self._unreferenced.pop(paper_id, None)
+
+    def _release(self, paper_id: str):
+        entry = self._entries[paper_id]
+        entry.refs -= 1
+        if entry.refs == 0:
+            self._unreferenced[paper_id] = None
+
+    def _evict(self):
+        while self.total_bytes > self.memory_budget and self._unreferenced:
+            paper_id, _ = self._unreferenced.popitem(last=False)
+            self.total_bytes -= self._entries.pop(paper_id).size
+
+    def set_session_results(self, session_id: str, papers: Iterable[Paper]) -> List[PaperRef]:
+        """
+        Intern a session's search results and return the refs it should keep.
+        Papers the session held from its previous results are released.
+        """
+        with self._lock:
+            refs = [PaperRef(self._intern(paper), paper.relevance_score) for paper in papers]
+            held = list(dict.fromkeys(ref.paper_id for ref in refs))
+            for paper_id in held:
+                self._acquire(paper_id)
+            for paper_id in self._sessions.pop(session_id, []):
+                self._release(paper_id)
+            if held:
+                self._sessions[session_id] = held
+            self._evict()
+        return refs
+
+    def release_session(self, session_id: str):
+        """Drop every reference a session holds, e.g. when it closes"""
+        with self._lock:
+            for paper_id in self._sessions.pop(session_id, []):
+                self._release(paper_id)
+            self._evict()
+
+    def get(self, paper_id: str) -> Optional[Paper]:
+        """The shared record for an ID; must not be mutated"""
+        entry = self._entries.get(paper_id)
+        return entry.paper if entry is not None else None
+
+    def resolve(self, ref: PaperRef) -> Paper:
+        """A shallow per-view copy of the record carrying the ref's relevance score"""
+        return dataclasses.replace(self._entries[ref.paper_id].paper, relevance_score=ref.relevance_score)
+
+    def resolve_many(self, refs: Iterable[PaperRef]) -> List[Paper]:
+        return [self.resolve(ref) for ref in refs]
+
+
+# Process-wide store shared by all Solara sessions
+paper_store = PaperStore()
@@ -5,13 +5,56 @@ This module provides transparent paper search functionality with explicitly docu
 ranking criteria for each data source.
 """
 
-import arxiv
-import requests
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
+from types import SimpleNamespace
+import re
+import threading
 import time
 
+class RateLimiter:
+    """
+    Spaces out calls to an external API by at least `min_interval` seconds.
+
+    The lock and the shared slot default to in-process objects; passing a
+    multiprocessing lock and `Value('d')` shares the limit across worker processes.
+    """
+    def __init__(self, min_interval: float, lock=None, last_call=None):
+        self.min_interval = min_interval
+        self._lock = lock if lock is not None else threading.Lock()
+        self._last_call = last_call if last_call is not None else SimpleNamespace(value=0.0)
+
+    def wait(self):
+        """Block until the next call is allowed and claim its slot"""
+        with self._lock:
+            delay = self._last_call.value + self.min_interval - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            self._last_call.value = time.time()
+
+# Shared limits for the external APIs; rebound by batch workers to cross-process limiters
+ARXIV_RATE_LIMITER = RateLimiter(3.0)
+SEMANTIC_SCHOLAR_RATE_LIMITER = RateLimiter(0.1)
+
+SEMANTIC_SCHOLAR_API_URL = "https://api.semanticscholar.org/graph/v1"
+
+_semantic_scholar_session = None
+_semantic_scholar_session_lock = threading.Lock()
+
+def get_semantic_scholar_session():
+    """
+    Process-wide pooled HTTP session for Semantic Scholar.
+    `requests` is imported on first use to keep module import cheap.
+    """
+    global _semantic_scholar_session
+    if _semantic_scholar_session is None:
+        with _semantic_scholar_session_lock:
+            if _semantic_scholar_session is None:
+                import requests
+                _semantic_scholar_session = requests.Session()
+    return _semantic_scholar_session
+
 @dataclass
 class RankingCriteria:
     """Documents the criteria used to rank and filter papers"""
@@ -64,18 +107,27 @@ class Paper:
             "relevance_score": round(self.relevance_score, 2)
         }
 
+ARXIV_URL_PATTERN = re.compile(r'arxiv\.org/(?:abs|pdf)/')
+
+def normalize_arxiv_id(arxiv_id: str) -> str:
+    """Reduce an arXiv URL or versioned ID to the bare ID, e.g. 2101.00001 or hep-th/9901001"""
+    # Keep everything after /abs/ or /pdf/ so old-style archive prefixes survive
+    match = ARXIV_URL_PATTERN.search(arxiv_id)
+    if match:
+        arxiv_id = arxiv_id[match.end():]
+    arxiv_id = re.sub(r'\.pdf$', '', arxiv_id)
+    return re.sub(r'v\d+$', '', arxiv_id)
+
 def get_citation_count_from_semantic_scholar(arxiv_id: str) -> tuple[Optional[int], List[str]]:
     """
     Fetch citation count and author affiliations from Semantic Scholar API for an arXiv paper.
     """
     try:
-        # Extract just the ID if full URL provided
-        if 'arxiv.org' in arxiv_id:
-            arxiv_id = arxiv_id.split('/')[-1]
-        arxiv_id = arxiv_id.split('v')[0]
-        url = f"https://api.semanticscholar.org/graph/v1/paper/arXiv:{arxiv_id}"
+        arxiv_id = normalize_arxiv_id(arxiv_id)
+        url = f"{SEMANTIC_SCHOLAR_API_URL}/paper/arXiv:{arxiv_id}"
         params = {"fields": "citationCount,title,authors,authors.affiliations"}
-        response = requests.get(url, params=params, timeout=5)
+        SEMANTIC_SCHOLAR_RATE_LIMITER.wait()
+        response = get_semantic_scholar_session().get(url, params=params, timeout=5)
         if response.status_code == 200:
             data = response.json()
             citation_count = data.get('citationCount', 0)
@@ -100,20 +152,16 @@ class ArxivSearchEngine:
     """
     arXiv Search Engine
     """
-    def __init__(self):
+    def __init__(self, client=None):
+        from arxiv_client import ArxivClient
         self.source_name = "arXiv"
+        self.client = client if client is not None else ArxivClient()
     def search(
         self,
         query: str,
         max_results: int = 10,
         sort_by: str = "relevance"
     ) -> tuple[List[Paper], RankingCriteria]:
-        sort_criteria_map = {
-            "relevance": arxiv.SortCriterion.Relevance,
-            "submittedDate": arxiv.SortCriterion.SubmittedDate,
-            "lastUpdatedDate": arxiv.SortCriterion.LastUpdatedDate
-        }
-        sort_criterion = sort_criteria_map.get(sort_by, arxiv.SortCriterion.Relevance)
         if sort_by == "citations":
             criteria = RankingCriteria(
                 source="arXiv",
@@ -122,6 +170,23 @@ class ArxivSearchEngine:
                 filters_applied=["Sorted by number of citations (Semantic Scholar)"],
                 description=f"Papers sorted by number of citations (descending). Citation data from Semantic Scholar. Results limited to top {max_results} papers."
             )
+        elif sort_by == "pagerank":
+            criteria = RankingCriteria(
+                source="arXiv",
+                sort_method="pagerank",
+                max_results=max_results,
+                filters_applied=[
+                    "Query keyword matching in title/abstract",
+                    "Ranked by personalized PageRank over the results' references and citers (Semantic Scholar)"
+                ],
+                description=f"Top {max_results} papers by arXiv relevance, re-ranked by personalized PageRank "
+                           f"over the graph of their references and citations from Semantic Scholar. "
+                           f"Only the results' own neighbourhoods are fetched, so every citer from outside "
+                           f"the results counts the same: a paper's score mostly follows its full citation "
+                           f"count. Citations among the results count more when they come from a more "
+                           f"relevant or better-cited result. "
+                           f"Papers without Semantic Scholar data are placed last in relevance order."
+            )
         else:
             criteria = RankingCriteria(
                 source="arXiv",
@@ -133,66 +198,64 @@ class ArxivSearchEngine:
                            f"position in title/abstract, and semantic similarity. "
                            f"Results limited to top {max_results} papers."
             )
-        search = arxiv.Search(
-            query=query,
-            max_results=max_results,
-            sort_by=sort_criterion
-        )
-        papers = []
-        for idx, result in enumerate(search.results()):
-            relevance = 1.0 - (idx / max_results) if max_results > 0 else 0.0
-            affiliations = []
-            seen_domains = set()
-            if hasattr(result, 'comment') and result.comment:
-                import re
-                email_pattern = r'[\w\.-]+@([\w\.-]+\.\w+)'
-                emails = re.findall(email_pattern, result.comment)
-                for domain in emails:
-                    if domain not in seen_domains:
-                        org_name = domain.split('.')[0].upper() if '.' in domain else domain.upper()
-                        if 'edu' in domain:
-                            org_name = domain.split('.')[0].replace('-', ' ').title()
-                        affiliations.append(org_name)
-                        seen_domains.add(domain)
-            for author in result.authors:
-                if hasattr(author, 'affiliation') and author.affiliation:
-                    if author.affiliation not in affiliations:
-                        affiliations.append(author.affiliation)
-            citation_count, semantic_affiliations = get_citation_count_from_semantic_scholar(result.entry_id)
-            if citation_count is None:
-                citation_count = 0
+        # Drain the feed before enrichment so the arXiv connection isn't held open
+        # while Semantic Scholar is queried paper by paper
+        papers = list(self.client.search(query, max_results, sort_by))
+        for idx, paper in enumerate(papers):
+            paper.relevance_score = 1.0 - (idx / max_results) if max_results > 0 else 0.0
+            citation_count, semantic_affiliations = get_citation_count_from_semantic_scholar(paper.url)
+            paper.citation_count = citation_count if citation_count is not None else 0
             for affiliation in semantic_affiliations:
-                if affiliation not in affiliations:
-                    affiliations.append(affiliation)
-            time.sleep(0.1)
-            paper = Paper(
-                title=result.title,
-                authors=[author.name for author in result.authors],
-                abstract=result.summary,
-                published_date=result.published,
-                url=result.entry_id,
-                pdf_url=result.pdf_url,
-                source="arXiv",
-                citation_count=citation_count,
-                relevance_score=relevance,
-                affiliations=affiliations[:3] if affiliations else []
-            )
-            papers.append(paper)
+                if affiliation not in paper.affiliations:
+                    paper.affiliations.append(affiliation)
+            paper.affiliations = paper.affiliations[:3]
         if sort_by == "citations":
             papers = sorted(papers, key=lambda p: p.citation_count, reverse=True)
             papers = papers[:max_results]
+        elif sort_by == "pagerank":
+            from citation_graph import citation_graph_scores
+            scores, covered = citation_graph_scores(papers)
+            if covered == 0:
+                criteria.filters_applied.append("No citation data from Semantic Scholar: kept arXiv relevance order")
+                criteria.description += " Citation data was unavailable for this search, so results are in arXiv relevance order."
+            else:
+                papers = [paper for _, paper in sorted(zip(scores, papers), key=lambda pair: pair[0], reverse=True)]
+                if covered < len(papers):
+                    criteria.filters_applied.append(f"Citation data found for {covered} of {len(papers)} papers")
         return papers, criteria
 
 class SearchEngineFactory:
-    """Factory to create appropriate search engine based on source"""
-    @staticmethod
-    def get_engine(source: str):
-        engines = {
-            "arXiv": ArxivSearchEngine(),
-        }
-        engine = engines.get(source)
-        if not engine:
-            raise ValueError(f"Search engine for source '{source}' not implemented yet")
+    """
+    Registry of search engines by source.
+
+    Engines are built lazily on first request and reused afterwards, so their
+    HTTP connection pools stay warm across searches and sessions.
+    """
+    _builders: Dict[str, Callable[[], Any]] = {
+        "arXiv": ArxivSearchEngine,
+    }
+    _instances: Dict[str, Any] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def register(cls, source: str, builder: Callable[[], Any]):
+        """Register (or replace) the builder for a source"""
+        with cls._lock:
+            cls._builders[source] = builder
+            cls._instances.pop(source, None)
+
+    @classmethod
+    def get_engine(cls, source: str):
+        engine = cls._instances.get(source)
+        if engine is not None:
+            return engine
+        with cls._lock:
+            engine = cls._instances.get(source)
+            if engine is None:
+                builder = cls._builders.get(source)
+                if not builder:
+                    raise ValueError(f"Search engine for source '{source}' not implemented yet")
+                engine = cls._instances[source] = builder()
         return engine
 
 def search_papers(
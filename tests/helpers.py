@@ -0,0 +1,26 @@
+from datetime import datetime
+from search_engine import Paper
+
+# Shared factory for Paper objects in tests; every field has a harmless default
+def make_paper(
+    title="Test Paper",
+    authors=("A",),
+    abstract="",
+    url="",
+    published_date=datetime(2024, 1, 1),
+    relevance_score=0.0,
+    affiliations=None
+):
+    return Paper(
+        title=title,
+        authors=list(authors),
+        abstract=abstract,
+        url=url,
+        published_date=published_date,
+        source="arXiv",
+        relevance_score=relevance_score,
+        affiliations=list(affiliations) if affiliations is not None else None
+    )
+
+def arxiv_url(n, version=1):
+    return f"http://arxiv.org/abs/2401.0000{n}v{version}"
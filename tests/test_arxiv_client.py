@@ -0,0 +1,114 @@
+import pytest
+from urllib.parse import parse_qs, urlparse
+import search_engine
+from search_engine import RateLimiter
+from arxiv_client import ArxivAPIError, ArxivClient, build_query_url, iter_feed, affiliations_from_comment
+
+# --- arXiv API Client Tests ---
+
+# A trimmed arXiv API response with the namespaces and fields the client reads
+RECORDED_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title type="html">ArXiv Query: search_query=all:quantum</title>
+  <opensearch:totalResults>2</opensearch:totalResults>
+  <opensearch:startIndex>0</opensearch:startIndex>
+  <entry>
+    <id>http://arxiv.org/abs/2101.00001v2</id>
+    <published>2021-01-01T18:00:00Z</published>
+    <title>Quantum Error
+      Correction at Scale</title>
+    <summary>  We study surface codes.
+    </summary>
+    <author><name>Ada Lovelace</name><arxiv:affiliation>University of Tromso</arxiv:affiliation></author>
+    <author><name>Alan Turing</name></author>
+    <arxiv:comment>Contact: ada@mit.edu</arxiv:comment>
+    <link href="http://arxiv.org/abs/2101.00001v2" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2101.00001v2" rel="related" type="application/pdf"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/2101.00002v1</id>
+    <published>2021-01-02T09:30:00Z</published>
+    <title>Second Paper</title>
+    <summary>Another abstract.</summary>
+    <author><name>Grace Hopper</name></author>
+  </entry>
+</feed>
+"""
+
+# Test: Query URLs carry the query, paging and sort parameters.
+# Expectation: Unknown sort keys fall back to relevance.
+def test_build_query_url():
+    params = parse_qs(urlparse(build_query_url("all:quantum", start=20, max_results=50, sort_by="citations")).query)
+    assert params == {
+        "search_query": ["all:quantum"],
+        "start": ["20"],
+        "max_results": ["50"],
+        "sortBy": ["relevance"],
+        "sortOrder": ["descending"]
+    }
+
+# Test: A feed split into tiny chunks is parsed into Papers incrementally.
+# Expectation: Fields are normalised and affiliations come from comments and author tags.
+def test_iter_feed_parses_chunked_feed():
+    chunks = [RECORDED_FEED[i:i + 37] for i in range(0, len(RECORDED_FEED), 37)]
+    papers = list(iter_feed(chunks))
+    assert [paper.url for paper in papers] == ["http://arxiv.org/abs/2101.00001v2", "http://arxiv.org/abs/2101.00002v1"]
+    first = papers[0]
+    assert first.title == "Quantum Error Correction at Scale"
+    assert first.abstract == "We study surface codes."
+    assert first.authors == ["Ada Lovelace", "Alan Turing"]
+    assert first.affiliations == ["Mit", "University of Tromso"]
+    assert first.pdf_url == "http://arxiv.org/pdf/2101.00001v2"
+    assert first.published_date.year == 2021 and first.published_date.utcoffset().total_seconds() == 0
+    assert papers[1].pdf_url == ""
+
+class FakeResponse:
+    def __init__(self, status_code, body=b""):
+        self.status_code = status_code
+        self.body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = responses
+        self.urls = []
+
+    def get(self, url, timeout, stream):
+        self.urls.append(url)
+        return self.responses.pop(0)
+
+# Test: The client sizes its single page to max_results and retries failed requests.
+# Expectation: A 503 is retried and every entry of the recorded feed is returned.
+def test_client_search_retries_and_sizes_page(monkeypatch):
+    monkeypatch.setattr(search_engine, "ARXIV_RATE_LIMITER", RateLimiter(0))
+    client = ArxivClient(chunk_size=64)
+    client.session = FakeSession([FakeResponse(503), FakeResponse(200, RECORDED_FEED)])
+    papers = list(client.search("all:quantum", max_results=5))
+    assert len(papers) == 2
+    assert len(client.session.urls) == 2
+    assert parse_qs(urlparse(client.session.urls[0]).query)["max_results"] == ["5"]
+
+# Test: Client errors such as a malformed query are not retried.
+# Expectation: A 400 raises after a single request.
+def test_client_search_does_not_retry_client_errors(monkeypatch):
+    monkeypatch.setattr(search_engine, "ARXIV_RATE_LIMITER", RateLimiter(0))
+    client = ArxivClient()
+    client.session = FakeSession([FakeResponse(400), FakeResponse(200, RECORDED_FEED)])
+    with pytest.raises(ArxivAPIError) as error:
+        list(client.search("all:(", max_results=5))
+    assert error.value.status_code == 400
+    assert len(client.session.urls) == 1
+
+# Test: E-mail domains in comments become organisation names once each.
+# Expectation: Duplicate domains are ignored.
+def test_affiliations_from_comment():
+    assert affiliations_from_comment("a@cern.ch, b@cern.ch") == ["CERN"]
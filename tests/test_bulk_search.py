@@ -0,0 +1,102 @@
+import io
+import json
+import sys
+import pytest
+from datetime import datetime
+import bulk_search
+from bulk_search import read_queries, Checkpoint, JsonlWriter, ParquetWriter, run_batch, main
+from search_engine import Paper, RankingCriteria
+
+# --- Bulk Search CLI Tests ---
+
+def fake_search_papers(query, source="arXiv", max_results=20, sort_by="relevance"):
+    if query == "boom":
+        raise RuntimeError("API down")
+    paper = Paper(title=f"About {query}", authors=["A"], abstract="", url="", published_date=datetime(2024, 1, 1), source=source)
+    criteria = RankingCriteria(source=source, sort_method=sort_by, max_results=max_results, filters_applied=[], description="")
+    return [paper], criteria
+
+# Test: Query files may contain blank lines and comments.
+# Expectation: Only real queries are yielded, numbered consecutively.
+def test_read_queries_skips_blank_and_comment_lines():
+    stream = io.StringIO("quantum\n\n# survey batch\nagentic AI\n")
+    assert list(read_queries(stream)) == [(0, "quantum"), (1, "agentic AI")]
+
+# Test: Out-of-order completions are folded into the checkpoint watermark.
+# Expectation: The watermark advances past contiguous indices and the file round-trips.
+def test_checkpoint_watermark_and_reload(tmp_path):
+    checkpoint = Checkpoint(str(tmp_path / "ckpt.json"))
+    checkpoint.mark_done([1, 0, 3])
+    assert checkpoint.watermark == 2
+    assert checkpoint.done_above == {3}
+    checkpoint.save()
+    reloaded = Checkpoint.load(str(tmp_path / "ckpt.json"))
+    assert reloaded.is_done(1) and reloaded.is_done(3) and not reloaded.is_done(2)
+
+# Test: A resumed batch skips succeeded queries and retries failed ones.
+# Expectation: "boom" fails, is rerun on resume as attempt 2, and is settled once it succeeds.
+def test_run_batch_streams_jsonl_and_resumes(tmp_path, monkeypatch):
+    outages = ["API down"]
+    def flaky_search_papers(query, **kwargs):
+        if query == "boom" and outages:
+            raise RuntimeError(outages.pop())
+        return fake_search_papers(query.replace("boom", "recovered"), **kwargs)
+    monkeypatch.setattr(bulk_search, "search_papers", flaky_search_papers)
+    output = tmp_path / "out.jsonl"
+    checkpoint_path = str(tmp_path / "out.ckpt")
+    checkpoint = Checkpoint(checkpoint_path)
+    checkpoint.mark_done([1])
+    stats = run_batch(read_queries(io.StringIO("a\nb\nboom\n")), JsonlWriter(str(output), append=False), checkpoint, workers=1, progress=None)
+    assert stats == {"done": 2, "failed": 1, "skipped": 1}
+
+    resumed = Checkpoint.load(checkpoint_path)
+    assert resumed.watermark == 3 and resumed.failed == {2: 1}
+    assert not resumed.is_done(2)
+    stats = run_batch(read_queries(io.StringIO("a\nb\nboom\n")), JsonlWriter(str(output), append=True), resumed, workers=1, progress=None)
+    assert stats == {"done": 1, "failed": 0, "skipped": 2}
+    assert Checkpoint.load(checkpoint_path).failed == {}
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [(record["query"], record["attempt"]) for record in records] == [("a", 1), ("boom", 1), ("boom", 2)]
+    assert records[0]["papers"][0]["title"] == "About a"
+    assert records[1]["error"] == "API down"
+    assert records[2]["papers"][0]["title"] == "About recovered"
+
+# Test: Parquet parts share one schema even when a part holds only failed queries.
+# Expectation: The directory reads back as a single table with paper columns intact.
+def test_run_batch_writes_parquet_parts_with_fixed_schema(tmp_path, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(bulk_search, "search_papers", fake_search_papers)
+    output = tmp_path / "out.parquet"
+    writer = ParquetWriter(str(output), append=False, batch_size=1)
+    run_batch(read_queries(io.StringIO("boom\na\n")), writer, Checkpoint(str(tmp_path / "ckpt.json")), workers=1, progress=None)
+    parts = sorted(output.iterdir())
+    assert len(parts) == 2
+    assert pq.read_schema(parts[0]) == pq.read_schema(parts[1])
+    rows = pq.read_table(output).to_pylist()
+    assert [(row["query"], row["attempt"], row["title"], row["authors"]) for row in rows] == [
+        ("boom", 1, None, None), ("a", 1, "About a", ["A"])
+    ]
+
+# Test: Without pyarrow, Parquet output is rejected before any query runs.
+# Expectation: The CLI exits with an error and searches nothing.
+def test_main_fails_fast_without_pyarrow(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    monkeypatch.setattr(bulk_search, "search_papers", lambda *args, **kwargs: pytest.fail("query ran"))
+    queries = tmp_path / "queries.txt"
+    queries.write_text("a\n")
+    with pytest.raises(SystemExit):
+        main([str(queries), "-o", str(tmp_path / "out.parquet"), "--quiet"])
+
+# Test: A mistyped queries path or an existing JSONL output is rejected up front.
+# Expectation: The CLI exits with an error and the existing results are left intact.
+def test_main_keeps_existing_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(bulk_search, "search_papers", lambda *args, **kwargs: pytest.fail("query ran"))
+    output = tmp_path / "out.jsonl"
+    output.write_text('{"index": 0}\n')
+    queries = tmp_path / "queries.txt"
+    queries.write_text("a\n")
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "nosuch.txt"), "-o", str(output), "--quiet"])
+    with pytest.raises(SystemExit):
+        main([str(queries), "-o", str(output), "--quiet"])
+    assert output.read_text() == '{"index": 0}\n'
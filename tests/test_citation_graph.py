@@ -0,0 +1,102 @@
+import pytest
+import numpy as np
+import citation_graph
+import search_engine
+from collections import OrderedDict
+from search_engine import RateLimiter
+from tests.helpers import make_paper, arxiv_url
+from citation_graph import (
+    CitationNeighborhood, build_csr, build_citation_graph, personalized_pagerank, citation_graph_scores,
+    fetch_citation_neighborhoods
+)
+
+# --- Citation Graph Ranking Tests ---
+
+# Test: Duplicate edges collapse and rows are grouped by source node.
+# Expectation: indptr/indices describe 0->1, 0->2 and 2->1.
+def test_build_csr_deduplicates_edges():
+    indptr, indices = build_csr(np.array([0, 2, 0, 0]), np.array([1, 1, 2, 1]), 3)
+    assert indptr.tolist() == [0, 2, 2, 3]
+    assert indices.tolist() == [1, 2, 1]
+
+# Test: Citations point into the seed and references point out of it.
+# Expectation: A missing neighbourhood gets seed node -1; unlisted citers become one weighted citing node.
+def test_build_citation_graph_edge_directions():
+    indptr, indices, seeds, weights = build_citation_graph([
+        CitationNeighborhood("s", references=("r",), citations=("c",), citation_count=3),
+        None
+    ])
+    assert seeds.tolist() == [0, -1]
+    edges = {(src, int(dst)) for src in range(len(indptr) - 1) for dst in indices[indptr[src]:indptr[src + 1]]}
+    assert edges == {(0, 1), (2, 0), (3, 0)}
+    assert weights.tolist() == [1.0, 1.0, 1.0, 2.0]
+
+# Test: PageRank is a probability distribution favouring cited nodes.
+# Expectation: Scores sum to 1 and the node cited three times outranks its citers.
+def test_personalized_pagerank_sums_to_one():
+    indptr, indices = build_csr(np.array([1, 2, 3, 0]), np.array([0, 0, 0, 4]), 5)
+    scores = personalized_pagerank(indptr, indices, np.ones(5))
+    assert scores.sum() == pytest.approx(1.0)
+    assert scores[0] > scores[1]
+
+# Test: A result cited by the other results outranks them, unknown papers score 0.
+# Expectation: Paper 2 (cited by papers 1 and 3) gets the top score.
+def test_citation_graph_scores_rank_cited_result_first():
+    neighborhoods = {
+        "2401.00001": CitationNeighborhood("s1", references=("s2",), citations=()),
+        "2401.00002": CitationNeighborhood("s2", references=(), citations=("s1", "s3", "x")),
+        "2401.00003": CitationNeighborhood("s3", references=("s2",), citations=()),
+    }
+    papers = [make_paper(url=arxiv_url(n), relevance_score=r) for n, r in ((1, 1.0), (2, 0.5), (3, 0.4), (4, 0.3))]
+    scores, covered = citation_graph_scores(papers, fetch=lambda ids: {i: neighborhoods.get(i) for i in ids})
+    assert max(scores) == scores[1]
+    assert scores[3] == 0.0
+    assert covered == 3
+
+# Test: Citers beyond a truncated citation list still count.
+# Expectation: A result with 50 citers (one listed) outranks one with 3 fully listed citers.
+def test_citation_graph_scores_use_full_citation_count():
+    neighborhoods = {
+        "2401.00001": CitationNeighborhood("s1", references=(), citations=("a", "b", "c"), citation_count=3),
+        "2401.00002": CitationNeighborhood("s2", references=(), citations=("d",), citation_count=50),
+    }
+    papers = [make_paper(url=arxiv_url(n), relevance_score=1.0) for n in (1, 2)]
+    scores, covered = citation_graph_scores(papers, fetch=lambda ids: {i: neighborhoods.get(i) for i in ids})
+    assert scores[1] > scores[0]
+    assert covered == 2
+
+# Test: Scoring when every Semantic Scholar batch failed.
+# Expectation: All scores are 0 and no paper is reported as covered.
+def test_citation_graph_scores_report_missing_data():
+    papers = [make_paper(url=arxiv_url(n)) for n in (1, 2)]
+    assert citation_graph_scores(papers, fetch=lambda ids: {}) == ([0.0, 0.0], 0)
+
+class FakeBatchResponse:
+    status_code = 200
+
+    def __init__(self, items):
+        self.items = items
+
+    def json(self):
+        return self.items
+
+class FakeBatchSession:
+    def post(self, url, params=None, json=None, timeout=None):
+        return FakeBatchResponse([
+            {"paperId": f"s-{i}", "citationCount": 7, "references": [{"paperId": f"r{n}"} for n in range(5)], "citations": []}
+            for i in json["ids"]
+        ])
+
+# Test: The neighbourhood cache is bounded by the total number of stored IDs.
+# Expectation: Full link lists and citation counts are kept; the oldest neighbourhoods are evicted first.
+def test_neighborhood_cache_bounded_by_stored_ids(monkeypatch):
+    monkeypatch.setattr(search_engine, "SEMANTIC_SCHOLAR_RATE_LIMITER", RateLimiter(0))
+    monkeypatch.setattr(search_engine, "get_semantic_scholar_session", lambda: FakeBatchSession())
+    monkeypatch.setattr(citation_graph, "_neighborhood_cache", OrderedDict())
+    monkeypatch.setattr(citation_graph, "_cache_ids", 0)
+    monkeypatch.setattr(citation_graph, "CACHE_MAX_IDS", 13)
+    fetched = fetch_citation_neighborhoods(["2401.00001", "2401.00002", "2401.00003"])
+    assert fetched["2401.00001"].references == ("r0", "r1", "r2", "r3", "r4")
+    assert fetched["2401.00001"].citation_count == 7
+    assert list(citation_graph._neighborhood_cache) == ["2401.00002", "2401.00003"]
+    assert citation_graph._cache_ids == 12
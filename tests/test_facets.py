@@ -0,0 +1,52 @@
+import pytest
+from datetime import datetime
+from tests.helpers import make_paper
+from facets import FacetIndex, toggle_selection
+
+# --- Faceted Filtering Tests ---
+
+def make_facet_paper(title, year, authors, affiliations):
+    return make_paper(title=title, url=title, published_date=datetime(year, 1, 1), authors=authors, affiliations=affiliations)
+
+PAPERS = [
+    make_facet_paper("p0", 2024, ["Ada", "Alan"], ["MIT"]),
+    make_facet_paper("p1", 2023, ["Ada"], ["UiT"]),
+    make_facet_paper("p2", 2024, ["Grace"], ["MIT", "UiT"]),
+]
+
+# Test: Values within a facet are ORed and facets are ANDed.
+# Expectation: Only papers from 2024 by Ada or Grace at UiT remain.
+def test_filter_combines_facets():
+    index = FacetIndex()
+    index.add(PAPERS)
+    assert index.filter(PAPERS, {}) == PAPERS
+    assert index.filter(PAPERS, {"year": {"2024"}, "author": {"Ada", "Grace"}}) == [PAPERS[0], PAPERS[2]]
+    assert index.filter(PAPERS, {"year": {"2024"}, "affiliation": {"UiT"}}) == [PAPERS[2]]
+    assert index.filter(PAPERS, {"author": {"Nobody"}}) == []
+
+# Test: Counts for a facet ignore that facet's own selection but honour the others.
+# Expectation: Selecting 2024 keeps both year counts and narrows author counts.
+def test_counts_are_disjunctive():
+    index = FacetIndex()
+    index.add(PAPERS)
+    counts = index.counts({"year": {"2024"}})
+    assert counts["year"] == [("2024", 2), ("2023", 1)]
+    assert dict(counts["author"]) == {"Ada": 1, "Alan": 1, "Grace": 1}
+    assert index.counts({}, limit=1)["author"] == [("Ada", 2)]
+
+# Test: Results added in several batches line up with their positions.
+# Expectation: Counts and filters match an index built in one go; repeated values count once.
+def test_add_in_batches():
+    index = FacetIndex()
+    index.add(PAPERS[:2])
+    index.add(PAPERS[2:] + [make_facet_paper("p3", 2022, ["Ada", "Ada"], [])])
+    assert index.size == 4
+    assert dict(index.counts({})["author"]) == {"Ada": 3, "Alan": 1, "Grace": 1}
+    assert index.filter(PAPERS, {"affiliation": {"UiT"}}) == [PAPERS[1], PAPERS[2]]
+
+# Test: Toggling a facet value flips its membership.
+# Expectation: The value is added, then removed again.
+def test_toggle_selection():
+    selection = toggle_selection({}, "year", "2024")
+    assert selection == {"year": frozenset({"2024"})}
+    assert toggle_selection(selection, "year", "2024") == {"year": frozenset()}
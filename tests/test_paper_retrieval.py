@@ -0,0 +1,62 @@
+import pytest
+from tests.helpers import make_paper
+from paper_retrieval import chunk_text, PaperIndex, PaperIndexCache, PaperChatBackend
+
+# --- Paper Chat Retrieval Tests ---
+
+# Test: Long text is split into several chunks that overlap by one sentence.
+# Expectation: Every chunk stays near the word budget and neighbours share a sentence.
+def test_chunk_text_overlaps_sentences():
+    text = " ".join(f"Sentence number {i} talks about topic {i}." for i in range(30))
+    chunks = chunk_text(text, chunk_words=20)
+    assert len(chunks) > 1
+    assert all(len(chunk.split()) <= 26 for chunk in chunks)
+    assert chunks[0].split(". ")[-1] in chunks[1]
+
+# Test: The chunk mentioning the query terms is ranked first.
+# Expectation: The transformer chunk wins a transformer question; unrelated queries return nothing.
+def test_paper_index_ranks_matching_chunk_first():
+    index = PaperIndex([
+        "We study graph neural networks for molecules.",
+        "Our transformer model uses sparse attention layers.",
+        "Experiments cover protein folding benchmarks."
+    ])
+    passages = index.search("which attention does the transformer use?", top_k=2)
+    assert passages[0].chunk_index == 1
+    assert index.search("zebra", top_k=2) == []
+
+# Test: The index cache evicts least recently used papers.
+# Expectation: The cache never holds more than max_papers indexes and keeps recently used ones.
+def test_index_cache_evicts_least_recently_used():
+    cache = PaperIndexCache(max_papers=2)
+    first = cache.get(make_paper(url="a", abstract="Alpha text."))
+    cache.get(make_paper(url="b", abstract="Beta text."))
+    assert cache.get(make_paper(url="a", abstract="Alpha text.")) is first
+    cache.get(make_paper(url="c", abstract="Gamma text."))
+    assert len(cache) == 2
+    assert cache.get(make_paper(url="a", abstract="Alpha text.")) is first
+
+# Test: Indexes are cached per full text, not just per paper.
+# Expectation: A different full text builds a new index; the same one is reused.
+def test_index_cache_keys_on_full_text():
+    cache = PaperIndexCache()
+    paper = make_paper(url="a", abstract="Alpha text.")
+    abstract_only = cache.get(paper)
+    first = cache.get(paper, full_text="Draft about graphs.")
+    second = cache.get(paper, full_text="Final version about transformers.")
+    assert len({id(abstract_only), id(first), id(second)}) == 3
+    assert cache.get(paper, full_text="Final version about transformers.") is second
+    assert cache.get(paper) is abstract_only
+    assert second.search("transformers")[0].text.endswith("transformers.")
+
+# Test: The backend passes retrieved passages to a pluggable generator and records the exchange.
+# Expectation: The chat history gains the user message and the generated answer.
+def test_chat_backend_send_handler_uses_generator():
+    backend = PaperChatBackend(generator=lambda question, passages, paper: f"{len(passages)} passages")
+    history = []
+    on_send = backend.send_handler(make_paper(abstract="Diffusion models generate images."), [], history.extend)
+    on_send("How are images generated?")
+    assert history == [
+        {"role": "user", "content": "How are images generated?"},
+        {"role": "assistant", "content": "1 passages"}
+    ]
@@ -0,0 +1,49 @@
+import pytest
+from tests.helpers import make_paper, arxiv_url
+from paper_store import PaperStore, PaperRef, paper_id_for
+
+# --- Shared Paper Store Tests ---
+
+# Test: Papers are keyed by their bare arXiv ID.
+# Expectation: The URL and version suffix are stripped; old-style archive prefixes are kept.
+def test_paper_id_is_bare_arxiv_id():
+    assert paper_id_for(make_paper(url=arxiv_url(1))) == "2401.00001"
+    assert paper_id_for(make_paper(url="http://arxiv.org/abs/hep-th/9901001v1")) == "hep-th/9901001"
+    assert paper_id_for(make_paper(url="http://arxiv.org/abs/cond-mat/9901001v2")) == "cond-mat/9901001"
+    assert paper_id_for(make_paper(url="https://arxiv.org/pdf/solv-int/9901001v3.pdf")) == "solv-int/9901001"
+
+# Test: Two sessions showing the same paper share one stored record.
+# Expectation: Both resolve to copies backed by the same abstract string, with their own scores.
+def test_sessions_share_interned_records():
+    store = PaperStore()
+    refs_a = store.set_session_results("a", [make_paper(url=arxiv_url(1), relevance_score=0.9, abstract="x" * 1000)])
+    refs_b = store.set_session_results("b", [make_paper(url=arxiv_url(1), relevance_score=0.2, abstract="x" * 1000)])
+    assert refs_a == [PaperRef("2401.00001", 0.9)]
+    assert len(store) == 1
+    paper_a, paper_b = store.resolve(refs_a[0]), store.resolve(refs_b[0])
+    assert paper_a.abstract is paper_b.abstract
+    assert (paper_a.relevance_score, paper_b.relevance_score) == (0.9, 0.2)
+    assert paper_a.authors == ("A",)
+
+# Test: Only papers no session references are evicted when over budget.
+# Expectation: The referenced paper survives; the released one is evicted first.
+def test_eviction_skips_referenced_records():
+    store = PaperStore(memory_budget=0)
+    store.set_session_results("a", [make_paper(url=arxiv_url(1))])
+    store.set_session_results("b", [make_paper(url=arxiv_url(2))])
+    assert "2401.00001" in store and "2401.00002" in store
+    store.release_session("a")
+    assert "2401.00001" not in store
+    assert "2401.00002" in store
+    store.set_session_results("b", [])
+    assert len(store) == 0 and store.total_bytes == 0
+
+# Test: Released papers stay cached while under budget.
+# Expectation: A later session reuses the cached record without it being re-counted.
+def test_unreferenced_records_cached_within_budget():
+    store = PaperStore()
+    store.set_session_results("a", [make_paper(url=arxiv_url(1))])
+    store.release_session("a")
+    size = store.total_bytes
+    store.set_session_results("b", [make_paper(url=arxiv_url(1))])
+    assert len(store) == 1 and store.total_bytes == size
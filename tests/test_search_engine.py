@@ -1,5 +1,10 @@
+import os
+import subprocess
+import sys
 import pytest
-from search_engine import search_papers, Paper
+from search_engine import search_papers, Paper, SearchEngineFactory
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # --- Search Functionality Tests ---
 
@@ -53,3 +58,26 @@ def test_search_no_results():
     # Simulate search by filtering papers
     results = [p for p in papers if "nonexistent" in p.title.lower()]
     assert len(results) == 0
+
+# --- Engine Registry Tests ---
+
+# Test: Engines are built once per source and reused.
+# Expectation: Repeated lookups return the same instance; unknown sources raise ValueError.
+def test_engine_registry_reuses_instances():
+    built = []
+    SearchEngineFactory.register("Test", lambda: built.append(object()) or built[-1])
+    try:
+        assert SearchEngineFactory.get_engine("Test") is SearchEngineFactory.get_engine("Test")
+        assert len(built) == 1
+    finally:
+        SearchEngineFactory._builders.pop("Test")
+        SearchEngineFactory._instances.pop("Test")
+    with pytest.raises(ValueError):
+        SearchEngineFactory.get_engine("PubMed")
+
+# Test: Importing the search module stays cheap.
+# Expectation: HTTP and data libraries are not imported until first use.
+def test_search_engine_import_is_lazy():
+    code = "import sys, search_engine; print(sorted(m for m in ('requests', 'numpy', 'pandas', 'arxiv') if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"